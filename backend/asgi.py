@@ -0,0 +1,340 @@
+import asyncio
+import hashlib
+import os
+import re
+import time
+from datetime import datetime
+from http.cookies import CookieError, SimpleCookie
+from types import SimpleNamespace
+from urllib.parse import parse_qsl
+
+from asgiref.wsgi import WsgiToAsgi
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from werkzeug.exceptions import NotFound
+
+from app import (
+    app, Event, Participants, Submissions, Submission_Values, Event_Statistics, Event_Counters,
+    cached_body, change_feed, counters_snapshot, event_counters_upsert, events_page, events_statement,
+    load_event_bundle, request_metrics, server_sent_event, statistics_payload, to_dict, validate_submission
+)
+from serialization import column_keys, dumps_bytes, loads
+
+# ASGI entry point: uvicorn asgi:application (or gunicorn with UvicornWorker).
+# The read-heavy endpoints and submit_responses are served by the async
+# handlers below on their own async Postgres pool, so a request waiting on the
+# database holds no thread. Every other route runs the Flask app through
+# asgiref's WSGI adapter, and rare cache misses reuse the Flask loaders in a
+# worker thread. Change feed streams are served here as well, so an open
+# dashboard holds no thread. Async handlers always use the primary and don't set the
+# read-your-writes marker, so run them without a replica configured.
+
+def async_database_url(url):
+    if os.environ.get('ASYNC_DATABASE_URL'):
+        return os.environ['ASYNC_DATABASE_URL']
+    return re.sub(r'^postgres(ql)?(\+\w+)?://', 'postgresql+psycopg://', url)
+
+engine_options = {
+    'pool_size': int(os.environ.get('ASYNC_DB_POOL_SIZE', 20)),
+    'max_overflow': int(os.environ.get('ASYNC_DB_MAX_OVERFLOW', 20)),
+    'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', 30)),
+    'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 1800)),
+    'pool_pre_ping': os.environ.get('DB_POOL_PRE_PING', '1') == '1'
+}
+if 'connect_args' in app.config['SQLALCHEMY_ENGINE_OPTIONS']:
+    engine_options['connect_args'] = app.config['SQLALCHEMY_ENGINE_OPTIONS']['connect_args']
+
+class Request:
+    def __init__(self, scope, receive, params):
+        self.scope = scope
+        self.receive = receive
+        self.params = params
+        self.method = scope['method']
+        self.args = {}
+        for key, value in parse_qsl(scope.get('query_string', b'').decode('latin-1'), keep_blank_values=True):
+            self.args.setdefault(key, value)  # First value wins, like request.args.get
+        self.headers = {name.decode('latin-1').lower(): value.decode('latin-1') for name, value in scope['headers']}
+        self.cookies = {}
+        try:
+            self.cookies = {name: morsel.value for name, morsel in SimpleCookie(self.headers.get('cookie', '')).items()}
+        except CookieError:
+            pass
+
+    async def body(self):
+        chunks = []
+        while True:
+            message = await self.receive()
+            chunks.append(message.get('body', b''))
+            if not message.get('more_body'):
+                return b''.join(chunks)
+
+class Response:
+    def __init__(self, payload=None, status=200, body=None, headers=None):
+        self.body = body if body is not None else dumps_bytes(payload)
+        self.status = status
+        self.headers = headers or {}
+
+    async def send(self, send):
+        headers = [(b'content-type', b'application/json'), (b'content-length', str(len(self.body)).encode())]
+        headers.extend((name.encode(), value.encode()) for name, value in self.headers.items())
+        await send({'type': 'http.response.start', 'status': self.status, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': self.body})
+
+# Body sent in chunks as chunks yields them, until the client disconnects
+class StreamingResponse:
+    def __init__(self, chunks, receive, content_type, headers=None):
+        self.chunks = chunks
+        self.receive = receive
+        self.content_type = content_type
+        self.status = 200
+        self.headers = headers or {}
+
+    async def wait_for_disconnect(self):
+        while (await self.receive())['type'] != 'http.disconnect':
+            pass
+
+    async def send(self, send):
+        headers = [(b'content-type', self.content_type.encode())]
+        headers.extend((name.encode(), value.encode()) for name, value in self.headers.items())
+        await send({'type': 'http.response.start', 'status': self.status, 'headers': headers})
+        disconnected = asyncio.ensure_future(self.wait_for_disconnect())
+        try:
+            async for chunk in self.chunks:
+                if disconnected.done():
+                    return
+                await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+            await send({'type': 'http.response.body', 'body': b''})
+        finally:
+            disconnected.cancel()
+            await self.chunks.aclose()
+
+# Statement count and SQL time for one request, reported to /metrics like the
+# Flask views' counters
+class Stats:
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.statements = 0
+        self.sql_seconds = 0.0
+
+    async def execute(self, conn, statement):
+        started = time.perf_counter()
+        try:
+            return await conn.execute(statement)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.statements += 1
+            self.sql_seconds += elapsed
+            if elapsed * 1000 >= app.config['SLOW_QUERY_MS']:
+                request_metrics.observe_slow_query(self.endpoint)
+                app.logger.warning("Slow query in %s (%.0f ms): %s", self.endpoint, elapsed * 1000, str(statement)[:1000])
+
+def in_app_context(fn, *args):
+    with app.app_context():
+        return fn(*args)
+
+# Session of the request, opened by the Flask session interface in a thread
+# since a server-side store may need a lookup
+async def load_session(request):
+    def open_session():
+        return app.session_interface.open_session(app, SimpleNamespace(cookies=request.cookies)) or {}
+    return dict(await asyncio.to_thread(in_app_context, open_session))
+
+# Cached metadata body with the same ETag handling as cached_json
+async def cached_response(request, key, loader):
+    try:
+        body = await asyncio.to_thread(in_app_context, cached_body, key, loader)
+    except NotFound:
+        return Response({"error": "Not found"}, 404)
+    etag = f'"{hashlib.sha1(body.encode()).hexdigest()}"'
+    headers = {'etag': etag, 'cache-control': 'no-cache'}
+    if etag in [tag.strip() for tag in request.headers.get('if-none-match', '').split(',')]:
+        return Response(status=304, body=b'', headers=headers)
+    return Response(body=body.encode(), headers=headers)
+
+async def get_events(request, engine, stats):
+    try:
+        stmt, fields, limit = events_statement(request.args)
+    except ValueError as e:
+        return Response({"error": str(e)}, 400)
+
+    async with engine.connect() as conn:
+        rows = (await stats.execute(conn, stmt)).all()
+    return Response(events_page(rows, fields, limit))
+
+async def get_event(request, engine, stats):
+    event_id = int(request.params['event_id'])
+    return await cached_response(request, f"event:{event_id}", lambda: to_dict(Event.query.get_or_404(event_id)))
+
+async def get_event_bundle(request, engine, stats):
+    event_id = int(request.params['event_id'])
+    return await cached_response(request, f"event:{event_id}:bundle", lambda: load_event_bundle(event_id))
+
+async def get_event_statistics(request, engine, stats):
+    event_id = int(request.params['event_id'])
+    session = await load_session(request)
+
+    async with engine.connect() as conn:
+        creator_id = (await stats.execute(conn, select(Event.creator_id).where(Event.event_id == event_id))).first()
+        if creator_id is None:
+            return Response({"error": "Not found"}, 404)
+
+        keys = column_keys(Event_Statistics)
+        query = select(*[getattr(Event_Statistics, key) for key in keys]).where(Event_Statistics.event_id == event_id)
+        if not ('creator_id' in session and creator_id[0] == session['creator_id']):
+            query = query.where(Event_Statistics.public_viewable.is_(True))
+        stored = (await stats.execute(conn, query)).all()
+        counters = (await stats.execute(conn, select(
+            Event_Counters.participant_count, Event_Counters.submission_count
+        ).where(Event_Counters.event_id == event_id))).first()
+
+    return Response(statistics_payload(
+        [dict(zip(keys, row)) for row in stored],
+        counters.participant_count if counters else 0,
+        counters.submission_count if counters else 0
+    ))
+
+async def submit_responses(request, engine, stats):
+    event_id = int(request.params['event_id'])
+    session = await load_session(request)
+    if 'user_id' not in session:
+        return Response({"error": "Not authenticated"}, 401)
+
+    async with engine.begin() as conn:
+        p_id = (await stats.execute(conn, select(Participants.P_id).where(
+            Participants.user_id == session['user_id'], Participants.event_id == event_id
+        ))).scalar()
+        if p_id is None:
+            return Response({"error": "Not participating in this event"}, 403)
+
+        try:
+            data = loads(await request.body())
+        except ValueError:
+            return Response({"error": "Invalid JSON body"}, 400)
+        if not isinstance(data, dict):
+            return Response({"error": "Invalid JSON body"}, 400)
+
+        values, error = await asyncio.to_thread(in_app_context, validate_submission, event_id, data.get('responses'))
+        if error:
+            return Response(error, 400)
+
+        submission_id = (await stats.execute(conn, insert(Submissions).values(
+            event_id=event_id, P_id=p_id, submitted_at=datetime.utcnow()
+        ).returning(Submissions.submission_id))).scalar()
+        if values:
+            await stats.execute(conn, insert(Submission_Values).values([
+                {"submission_id": submission_id, "input_id": input_id, "value": value}
+                for input_id, value in values.items()
+            ]))
+        await stats.execute(conn, event_counters_upsert(event_id, submissions=1))
+
+    return Response({
+        "message": "Submission successful",
+        "submission_id": submission_id
+    }, 201)
+
+async def stream_event_changes(request, engine, stats):
+    event_id = int(request.params['event_id'])
+    if not app.config['CHANGEFEED_ENABLED']:
+        return Response({"error": "Not found"}, 404)
+
+    loop = asyncio.get_running_loop()
+    ready = asyncio.Event()
+    subscriber = change_feed.subscribe(event_id, lambda: loop.call_soon_threadsafe(ready.set))
+    if subscriber is None:
+        return Response({"error": "Too many open change streams"}, 503)
+
+    # Read after subscribing so no change falls between snapshot and stream
+    try:
+        async with engine.connect() as conn:
+            row = (await stats.execute(conn, select(
+                Event.event_id, Event_Counters.participant_count, Event_Counters.submission_count
+            ).outerjoin(Event_Counters, Event_Counters.event_id == Event.event_id).where(
+                Event.event_id == event_id
+            ))).first()
+    except BaseException:
+        change_feed.unsubscribe(subscriber)
+        raise
+    if row is None:
+        change_feed.unsubscribe(subscriber)
+        return Response({"error": "Not found"}, 404)
+
+    async def stream():
+        try:
+            yield server_sent_event('snapshot', counters_snapshot(event_id, row[1] or 0, row[2] or 0))
+            while True:
+                try:
+                    await asyncio.wait_for(ready.wait(), app.config['CHANGEFEED_HEARTBEAT'])
+                except asyncio.TimeoutError:
+                    yield b': keepalive\n\n'
+                    continue
+                ready.clear()
+                change = subscriber.take()
+                if change:
+                    yield server_sent_event('change', change)
+        finally:
+            change_feed.unsubscribe(subscriber)
+
+    return StreamingResponse(stream(), request.receive, 'text/event-stream', {
+        'cache-control': 'no-cache',
+        'x-accel-buffering': 'no'
+    })
+
+# (method, path pattern, handler), handler names match the Flask endpoints
+ROUTES = [
+    ('GET', re.compile(r'/api/events'), get_events),
+    ('GET', re.compile(r'/api/events/(?P<event_id>\d+)'), get_event),
+    ('GET', re.compile(r'/api/events/(?P<event_id>\d+)/bundle'), get_event_bundle),
+    ('GET', re.compile(r'/api/events/(?P<event_id>\d+)/statistics'), get_event_statistics),
+    ('GET', re.compile(r'/api/events/(?P<event_id>\d+)/changes'), stream_event_changes),
+    ('POST', re.compile(r'/api/events/(?P<event_id>\d+)/submit'), submit_responses)
+]
+
+class AsyncApplication:
+    def __init__(self, flask_app):
+        self.wsgi = WsgiToAsgi(flask_app)
+        self.engine = None
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            return await self.lifespan(receive, send)
+        if scope['type'] == 'http':
+            for method, pattern, handler in ROUTES:
+                match = pattern.fullmatch(scope['path'])
+                if match and scope['method'] == method:
+                    return await self.handle(handler, Request(scope, receive, match.groupdict()), send)
+        return await self.wsgi(scope, receive, send)
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                self.engine = create_async_engine(
+                    async_database_url(app.config['SQLALCHEMY_DATABASE_URI']), **engine_options
+                )
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                if self.engine is not None:
+                    await self.engine.dispose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def handle(self, handler, request, send):
+        if self.engine is None:  # Server without lifespan support
+            self.engine = create_async_engine(async_database_url(app.config['SQLALCHEMY_DATABASE_URI']), **engine_options)
+
+        stats = Stats(handler.__name__)
+        started = time.perf_counter()
+        try:
+            response = await handler(request, self.engine, stats)
+        except Exception as e:
+            app.logger.exception("Error in %s", handler.__name__)
+            response = Response({"error": str(e)}, 500)
+
+        if app.config['METRICS_ENABLED']:
+            request_metrics.observe(
+                handler.__name__, request.method, response.status,
+                time.perf_counter() - started, stats.statements, stats.sql_seconds
+            )
+        await response.send(send)
+
+application = AsyncApplication(app)
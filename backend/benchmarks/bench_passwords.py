@@ -0,0 +1,42 @@
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from passwords import PasswordHasher
+
+# Logins per second for a hashing method: one core inline, then through the
+# process pool driven by concurrent request threads.
+# Run with: python backend/benchmarks/bench_passwords.py --method pbkdf2:sha256:600000
+
+def logins_per_second(hasher, pwhash, logins, threads):
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = list(pool.map(lambda _: hasher.verify(pwhash, 'correct horse'), range(logins)))
+    assert all(results)
+    return logins / (time.perf_counter() - started)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--method', default='scrypt')
+    parser.add_argument('--logins', type=int, default=200)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    
+    inline = PasswordHasher(method=args.method, workers=0)
+    pwhash = inline.hash('correct horse')
+    print(f"method: {inline.method}")
+    
+    per_core = logins_per_second(inline, pwhash, max(args.logins // 10, 10), 1)
+    print(f"inline:  {per_core:8.1f} logins/s on one core")
+    
+    pooled = PasswordHasher(method=args.method, workers=args.workers)
+    pooled.verify(pwhash, 'correct horse')  # Start the pool outside the timing
+    total = logins_per_second(pooled, pwhash, args.logins, args.workers * 4)
+    print(f"pool:    {total:8.1f} logins/s with {args.workers} workers ({total / args.workers:.1f} per core)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask.json.provider import DefaultJSONProvider
+
+from app import app, Event, to_dict
+from serialization import stream_array
+
+# Serializing a large event list: the reflective to_dict with Flask's default
+# encoder against the compiled serializers, column tuples and orjson.
+# Run with: python backend/benchmarks/bench_serialization.py --rows 100000
+
+def reflective_to_dict(obj):
+    return {c.key: getattr(obj, c.key) for c in obj.__table__.columns}
+
+def timed(label, fn, rows):
+    started = time.perf_counter()
+    body = fn()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<34} {elapsed * 1000:9.1f} ms  {rows / elapsed:12.0f} rows/s  {len(body) / 1e6:6.1f} MB")
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+
+    start = datetime(2025, 1, 1, 9, 30)
+    events = [
+        Event(
+            event_id=i, creator_id=i % 100, event_name=f"Event {i}", event_place="Main Hall",
+            event_start_date=start + timedelta(hours=i), event_end_date=start + timedelta(hours=i + 3),
+            deadline_enforced=False, status='Open', capacity=None
+        )
+        for i in range(args.rows)
+    ]
+    columns = [c.key for c in Event.__table__.columns]
+    # What Query.with_entities returns, without the ORM objects
+    tuples = [tuple(getattr(e, key) for key in columns) for e in events]
+
+    legacy_json = DefaultJSONProvider(app)
+    with app.app_context():
+        baseline = timed("to_dict + default encoder", lambda: legacy_json.dumps([reflective_to_dict(e) for e in events]), args.rows)
+        compiled = timed("compiled serializer + encoder", lambda: app.json.dumps([to_dict(e) for e in events]), args.rows)
+        rows = timed("column tuples + encoder", lambda: app.json.dumps([dict(zip(columns, t)) for t in tuples]), args.rows)
+        streamed = timed("streamed array (chunks joined)", lambda: b''.join(stream_array(events, to_dict)), args.rows)
+
+    print(f"speedup: compiled {baseline / compiled:.1f}x, tuples {baseline / rows:.1f}x, streamed {baseline / streamed:.1f}x")
+
+if __name__ == '__main__':
+    main()
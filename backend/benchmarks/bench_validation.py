@@ -0,0 +1,41 @@
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from validation import SubmissionValidator
+
+# Per-submission cost of a compiled validator on a typical ten-field form.
+# Run with: python backend/benchmarks/bench_validation.py
+
+INPUTS = [
+    {"input_id": 1, "field_type": "text", "validation_rules": '{"required": true, "max_length": 100}', "default_value": None},
+    {"input_id": 2, "field_type": "text", "validation_rules": '{"pattern": "[^@]+@[^@]+"}', "default_value": None},
+    {"input_id": 3, "field_type": "number", "validation_rules": '{"min": 0, "max": 120, "integer": true}', "default_value": None},
+    {"input_id": 4, "field_type": "number", "validation_rules": None, "default_value": "0"},
+    {"input_id": 5, "field_type": "date", "validation_rules": '{"min": "2000-01-01"}', "default_value": None},
+    {"input_id": 6, "field_type": "boolean", "validation_rules": '{"required": true}', "default_value": None},
+    {"input_id": 7, "field_type": "select", "validation_rules": '{"options": ["S", "M", "L", "XL"]}', "default_value": "M"},
+    {"input_id": 8, "field_type": "select", "validation_rules": '{"options": ["yes", "no", "maybe"]}', "default_value": None},
+    {"input_id": 9, "field_type": "text", "validation_rules": None, "default_value": None},
+    {"input_id": 10, "field_type": "date", "validation_rules": None, "default_value": None}
+]
+
+RESPONSES = {
+    1: "Ada Lovelace", 2: "ada@example.com", 3: "36", 4: 12.5, 5: "2024-05-01",
+    6: "yes", 7: "L", 8: "maybe", 9: "Looking forward to it", 10: "2024-06-30"
+}
+
+def main(number=100000):
+    validator = SubmissionValidator(INPUTS)
+    values, errors = validator.validate(RESPONSES)
+    assert not errors, errors
+
+    compile_seconds = timeit.timeit(lambda: SubmissionValidator(INPUTS), number=1000) / 1000
+    validate_seconds = timeit.timeit(lambda: validator.validate(RESPONSES), number=number) / number
+    print(f"compile:  {compile_seconds * 1e6:8.2f} us per event")
+    print(f"validate: {validate_seconds * 1e6:8.2f} us per submission ({len(INPUTS)} fields)")
+
+if __name__ == '__main__':
+    main()
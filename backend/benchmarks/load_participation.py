@@ -0,0 +1,125 @@
+import argparse
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func, insert
+
+import migrate
+from app import app, db, Users, Creator, Event, Event_Counters, Participants, Waitlist
+
+# Fires concurrent joins at one capacity-limited event through the real
+# participate route and checks that it never oversells.
+# Needs DATABASE_URL pointing at a disposable local Postgres, pending
+# migrations are applied so the run sees the real constraints:
+#   python backend/benchmarks/load_participation.py --users 5000 --capacity 1000 --concurrency 64
+
+SEED_BATCH_SIZE = 1000
+
+def seed(user_count, capacity):
+    stamp = int(time.time() * 1000)
+    users = [
+        {"FName": "Load", "LName": str(i), "email": f"load-{stamp}-{i}@example.com",
+         "gender": "other", "DOB": date(1990, 1, 1), "password": "!"}
+        for i in range(user_count + 1)
+    ]
+    # In batches, one multi-row INSERT per batch stays under the driver's
+    # bind parameter limit
+    user_ids = []
+    for start in range(0, len(users), SEED_BATCH_SIZE):
+        batch = users[start:start + SEED_BATCH_SIZE]
+        user_ids.extend(row[0] for row in db.session.execute(insert(Users).values(batch).returning(Users.user_id)))
+    
+    creator_id = user_ids.pop()
+    db.session.add(Creator(creator_id=creator_id))
+    event = Event(
+        creator_id=creator_id,
+        event_name=f"Load test {stamp}",
+        event_place="Benchmark",
+        event_start_date=datetime.utcnow(),
+        event_end_date=datetime.utcnow(),
+        status='Open',
+        capacity=capacity
+    )
+    db.session.add(event)
+    db.session.flush()
+    db.session.add(Event_Counters(event_id=event.event_id))
+    db.session.commit()
+    return event.event_id, user_ids
+
+def join(event_id, user_id):
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['user_id'] = user_id
+    
+    started = time.perf_counter()
+    response = client.post(f'/api/events/{event_id}/participate')
+    return response.status_code, time.perf_counter() - started
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--users', type=int, default=5000)
+    parser.add_argument('--capacity', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--max-p99-ms', type=float, default=500.0)
+    args = parser.parse_args()
+    
+    with app.app_context():
+        migrate.upgrade(db.engine)
+        event_id, user_ids = seed(args.users, args.capacity)
+    
+    # Every user tries to join twice to also exercise duplicate protection
+    attempts = user_ids + user_ids
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        results = list(pool.map(lambda user_id: join(event_id, user_id), attempts))
+    elapsed = time.perf_counter() - started
+    
+    latencies = sorted(latency * 1000 for _, latency in results)
+    codes = {}
+    for code, _ in results:
+        codes[code] = codes.get(code, 0) + 1
+    
+    with app.app_context():
+        participants = Participants.query.filter_by(event_id=event_id).count()
+        distinct_users = db.session.query(func.count(func.distinct(Participants.user_id))).filter(
+            Participants.event_id == event_id
+        ).scalar()
+        waitlisted = Waitlist.query.filter_by(event_id=event_id).count()
+        counter = Event_Counters.query.get(event_id).participant_count
+    
+    print(f"requests:     {len(results)} in {elapsed:.2f}s ({len(results) / elapsed:.0f}/s)")
+    print(f"status codes: {dict(sorted(codes.items()))}")
+    print(f"latency ms:   p50 {statistics.median(latencies):.1f}  "
+          f"p95 {percentile(latencies, 0.95):.1f}  p99 {percentile(latencies, 0.99):.1f}")
+    print(f"participants: {participants} (capacity {args.capacity}, counter {counter}), waitlisted {waitlisted}")
+    
+    failures = []
+    if participants > args.capacity:
+        failures.append("oversold")
+    if distinct_users != participants:
+        failures.append("duplicate participations")
+    if counter != participants:
+        failures.append("seat counter out of step")
+    if participants + waitlisted != len(user_ids):
+        failures.append("users lost between seats and waitlist")
+    if codes.get(500):
+        failures.append("server errors")
+    if percentile(latencies, 0.99) > args.max_p99_ms:
+        failures.append(f"p99 above {args.max_p99_ms} ms")
+    
+    if failures:
+        print("FAILED: " + ", ".join(failures))
+        sys.exit(1)
+    print("OK")
+
+if __name__ == '__main__':
+    main()
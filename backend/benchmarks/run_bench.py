@@ -0,0 +1,260 @@
+import argparse
+import http.cookiejar
+import itertools
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synthetic import Dataset, PASSWORD, sample_value
+
+# Drives the real routes against a dataset seeded by synthetic.py and reports
+# throughput and latency percentiles per scenario. Requests go through the
+# Flask test client in this process, or over HTTP to a running server with
+# --base-url (e.g. several gunicorn workers).
+#   python backend/benchmarks/run_bench.py --manifest bench-data.json --output results.json
+#   python backend/benchmarks/run_bench.py --manifest bench-data.json --baseline results.json
+
+SCENARIOS = ['list_events', 'bundle', 'participate', 'submit', 'statistics', 'reminders']
+
+class InProcessClient:
+    def __init__(self):
+        from app import app
+
+        self.app = app
+
+    # Returns a function issuing requests as the given session
+    def session(self, values):
+        client = self.app.test_client()
+        if values:
+            with client.session_transaction() as sess:
+                sess.update(values)
+
+        def send(method, path, body=None):
+            response = client.open(path, method=method, json=body)
+            return response.status_code
+        return send
+
+class HttpClient:
+    def __init__(self, base_url, dataset):
+        self.base_url = base_url.rstrip('/')
+        self.dataset = dataset
+        self._openers = {}
+        self._lock = threading.Lock()
+
+    def _request(self, opener, method, path, body=None):
+        data = json.dumps(body).encode() if body is not None else None
+        request = urllib.request.Request(self.base_url + path, data=data, method=method)
+        if data is not None:
+            request.add_header('Content-Type', 'application/json')
+        try:
+            with opener.open(request) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as e:
+            return e.code
+
+    # Logs in once per user and reuses the cookie, so logins aren't measured
+    def session(self, values):
+        key = (values.get('creator_id'), values.get('user_id'))
+        with self._lock:
+            opener = self._openers.get(key)
+        if opener is None:
+            opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()))
+            if values:
+                kind = 'creator' if 'creator_id' in values else 'participant'
+                user_index = values['user_id'] - self.dataset.first_user_id
+                status = self._request(opener, 'POST', f'/api/{kind}/login', {
+                    "email": self.dataset.email(user_index), "password": PASSWORD
+                })
+                if status != 200:
+                    raise RuntimeError(f"{kind} login failed with {status}")
+            with self._lock:
+                self._openers[key] = opener
+
+        def send(method, path, body=None):
+            return self._request(opener, method, path, body)
+        return send
+
+# Each scenario returns (session values, method, path, body) for request n
+class Workload:
+    def __init__(self, dataset, seed_value=1):
+        self.data = dataset
+        self.rng = random.Random(seed_value)
+        self._lock = threading.Lock()
+        # Next free member per event for joins, continuing after seeded members
+        self._joined = {}
+        self._events = itertools.count()
+
+    def random_event(self):
+        with self._lock:
+            return self.rng.randrange(self.data.events)
+
+    def list_events(self):
+        with self._lock:
+            day = (datetime.utcnow() + timedelta(days=self.rng.randrange(-365, 365))).strftime('%Y-%m-%d')
+        return {}, 'GET', f'/api/events?status=Open&from={day}&limit=50', None
+
+    def bundle(self):
+        return {}, 'GET', f'/api/events/{self.data.event_id(self.random_event())}/bundle', None
+
+    def participate(self):
+        with self._lock:
+            # Rotate through events so joins don't all queue on one seat lock
+            event_index = next(self._events) % self.data.events
+            member = self._joined.get(event_index, self.data.participants_per_event)
+            if member >= self.data.users:
+                raise RuntimeError("Every user already joined this event, seed more users")
+            self._joined[event_index] = member + 1
+        user_id = self.data.participant_user_id(event_index, member)
+        return {'user_id': user_id}, 'POST', f'/api/events/{self.data.event_id(event_index)}/participate', None
+
+    def submit(self):
+        event_index = self.random_event()
+        with self._lock:
+            member = self.rng.randrange(self.data.participants_per_event)
+            responses = {
+                str(input_id): sample_value(field_type, self.rng)
+                for input_id, field_type in self.data.input_ids(event_index)
+            }
+        user_id = self.data.participant_user_id(event_index, member)
+        return {'user_id': user_id}, 'POST', f'/api/events/{self.data.event_id(event_index)}/submit', {
+            "responses": responses
+        }
+
+    def statistics(self):
+        event_index = self.random_event()
+        creator_id = self.data.creator_id(event_index)
+        return {'user_id': creator_id, 'creator_id': creator_id}, 'GET', \
+            f'/api/events/{self.data.event_id(event_index)}/statistics', None
+
+    def reminders(self):
+        event_index = self.random_event()
+        creator_id = self.data.creator_id(event_index)
+        return {'user_id': creator_id, 'creator_id': creator_id}, 'POST', \
+            f'/api/events/{self.data.event_id(event_index)}/reminders', {}
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+def run_scenario(client, workload, name, requests, concurrency, warmup):
+    make_request = getattr(workload, name)
+
+    # Sessions are prepared outside the timed part
+    def prepare(_):
+        values, method, path, body = make_request()
+        return client.session(values), method, path, body
+
+    def timed(prepared):
+        send, method, path, body = prepared
+        started = time.perf_counter()
+        status = send(method, path, body)
+        return status, time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(timed, pool.map(prepare, range(warmup))))
+        prepared = list(pool.map(prepare, range(requests)))
+        started = time.perf_counter()
+        results = list(pool.map(timed, prepared))
+        elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency * 1000 for _, latency in results)
+    codes = {}
+    for code, _ in results:
+        codes[str(code)] = codes.get(str(code), 0) + 1
+    return {
+        "requests": len(results),
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 3),
+        "throughput": round(len(results) / elapsed, 1),
+        "errors": sum(count for code, count in codes.items() if int(code) >= 500),
+        "status_codes": dict(sorted(codes.items())),
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies), 2),
+            "p50": round(percentile(latencies, 0.50), 2),
+            "p95": round(percentile(latencies, 0.95), 2),
+            "p99": round(percentile(latencies, 0.99), 2),
+            "max": round(latencies[-1], 2)
+        }
+    }
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_results(results, baseline=None):
+    print(f"{'scenario':<12} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'5xx':>5}")
+    for name, result in results["scenarios"].items():
+        latency = result["latency_ms"]
+        print(f"{name:<12} {result['throughput']:>9.1f} {latency['p50']:>9.2f} "
+              f"{latency['p95']:>9.2f} {latency['p99']:>9.2f} {result['errors']:>5}")
+        previous = (baseline or {}).get("scenarios", {}).get(name)
+        if previous:
+            change = lambda new, old: f"{(new - old) / old * 100:+.1f}%" if old else 'n/a'
+            print(f"{'  vs base':<12} {change(result['throughput'], previous['throughput']):>9} "
+                  f"{change(latency['p50'], previous['latency_ms']['p50']):>9} "
+                  f"{change(latency['p95'], previous['latency_ms']['p95']):>9} "
+                  f"{change(latency['p99'], previous['latency_ms']['p99']):>9}")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--manifest', default='bench-data.json', help='Dataset written by synthetic.py')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS))
+    parser.add_argument('--requests', type=int, default=2000, help='Timed requests per scenario')
+    parser.add_argument('--warmup', type=int, default=100)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--base-url', default=None, help='Benchmark a running server instead of the test client')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', default=None, help='Write results to this JSON file')
+    parser.add_argument('--baseline', default=None, help='Earlier results file to compare against')
+    args = parser.parse_args()
+
+    with open(args.manifest) as f:
+        dataset = Dataset(json.load(f))
+    names = [name for name in args.scenarios.split(',') if name]
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    client = HttpClient(args.base_url, dataset) if args.base_url else InProcessClient()
+    workload = Workload(dataset, args.seed)
+
+    results = {
+        "started_at": datetime.utcnow().isoformat(timespec='seconds'),
+        "revision": git_revision(),
+        "target": args.base_url or 'test-client',
+        "dataset": dataset.manifest,
+        "scenarios": {}
+    }
+    for name in names:
+        print(f"Running {name}...", file=sys.stderr)
+        results["scenarios"][name] = run_scenario(client, workload, name, args.requests, args.concurrency, args.warmup)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Wrote {args.output}", file=sys.stderr)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,269 @@
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app, db, password_hasher
+
+# Synthetic data for benchmarks, loaded with COPY. Ids are allocated as
+# contiguous blocks after the current maximum, and everything else (which users
+# join which event, each event's inputs) is derived from the block offsets, so
+# a seeded dataset is described by a small manifest instead of id lists.
+# Needs DATABASE_URL pointing at a disposable local Postgres:
+#   python backend/benchmarks/synthetic.py --users 100000 --events 10000 --manifest bench-data.json
+
+PASSWORD = 'benchmark'
+COPY_CHUNK_SIZE = 64 * 1024
+STATUSES = ['Open'] * 7 + ['Closed'] * 2 + ['Cancelled']
+PLACES = ['Lahore', 'Karachi', 'Islamabad', 'Online', 'Main Hall', 'Auditorium', 'Lab 3', 'Sports Complex']
+WORDS = ['Annual', 'Spring', 'Coding', 'Music', 'Charity', 'Research', 'Career', 'Robotics', 'Film', 'Debate']
+KINDS = ['Fair', 'Contest', 'Workshop', 'Meetup', 'Symposium', 'Hackathon', 'Run', 'Summit']
+
+# Field definitions cycled through each event's inputs: (field_type, validation_rules)
+INPUT_CYCLE = [
+    ('text', '{"required": true, "max_length": 100}'),
+    ('number', '{"min": 0, "max": 100, "integer": true}'),
+    ('select', '{"options": ["S", "M", "L", "XL"]}'),
+    ('boolean', None),
+    ('date', None)
+]
+
+def input_type(position):
+    return INPUT_CYCLE[position % len(INPUT_CYCLE)][0]
+
+def sample_value(field_type, rng):
+    if field_type == 'text':
+        return f"Answer {rng.randrange(10000)}"
+    if field_type == 'number':
+        return str(rng.randrange(101))
+    if field_type == 'select':
+        return rng.choice(['S', 'M', 'L', 'XL'])
+    if field_type == 'boolean':
+        return rng.choice(['true', 'false'])
+    return (date(2024, 1, 1) + timedelta(days=rng.randrange(365))).isoformat()
+
+class Dataset:
+    # manifest is the dict written by seed()
+    def __init__(self, manifest):
+        self.manifest = manifest
+        for key, value in manifest.items():
+            setattr(self, key, value)
+
+    def user_id(self, index):
+        return self.first_user_id + index
+
+    def creator_id(self, event_index):
+        return self.first_user_id + event_index % self.creators
+
+    def event_id(self, event_index):
+        return self.first_event_id + event_index
+
+    # Users of an event come from a stride through the user block, members
+    # 0..participants_per_event-1 are seeded, later ones are free to join
+    def member_index(self, event_index, member):
+        return (event_index * self.stride + member) % self.users
+
+    def participant_user_id(self, event_index, member):
+        return self.user_id(self.member_index(event_index, member))
+
+    def p_id(self, event_index, member):
+        return self.first_p_id + event_index * self.participants_per_event + member
+
+    def input_ids(self, event_index):
+        first = self.first_input_id + event_index * self.inputs_per_event
+        return [(first + position, input_type(position)) for position in range(self.inputs_per_event)]
+
+    def email(self, user_index):
+        return f"bench-{self.tag}-{user_index}@example.com"
+
+# File-like object over an iterator of text lines, for COPY without building
+# the whole table in memory
+class LineReader:
+    def __init__(self, lines):
+        self.lines = iter(lines)
+        self.buffer = ''
+
+    def read(self, size=-1):
+        while size < 0 or len(self.buffer) < size:
+            line = next(self.lines, None)
+            if line is None:
+                break
+            self.buffer += line
+        if size < 0:
+            size = len(self.buffer)
+        chunk, self.buffer = self.buffer[:size], self.buffer[size:]
+        return chunk
+
+def copy_field(value):
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n')
+
+def copy_rows(cursor, table, columns, rows):
+    lines = ('\t'.join(copy_field(v) for v in row) + '\n' for row in rows)
+    sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN"
+    started = time.perf_counter()
+    if hasattr(cursor, 'copy_expert'):  # psycopg2
+        cursor.copy_expert(sql, LineReader(lines))
+    else:  # psycopg 3
+        reader = LineReader(lines)
+        with cursor.copy(sql) as copy:
+            for chunk in iter(lambda: reader.read(COPY_CHUNK_SIZE), ''):
+                copy.write(chunk)
+    print(f"  {table:<18} {cursor.rowcount:>10} rows in {time.perf_counter() - started:.1f}s")
+    return cursor.rowcount
+
+def next_id(cursor, table, column):
+    cursor.execute(f"SELECT COALESCE(MAX({column}), 0) + 1 FROM {table}")
+    return cursor.fetchone()[0]
+
+def advance_sequence(cursor, table, column):
+    cursor.execute(
+        f"SELECT setval(pg_get_serial_sequence('{table}', '{column}'), (SELECT MAX({column}) FROM {table}))"
+    )
+
+def seed(users=10000, creators=100, events=1000, inputs_per_event=5, participants_per_event=50,
+         submission_rate=0.6, seed_value=1):
+    if creators > users:
+        raise ValueError("creators must not exceed users")
+    if participants_per_event >= users:
+        raise ValueError("participants_per_event must be below users")
+
+    rng = random.Random(seed_value)
+    pwhash = password_hasher.hash(PASSWORD)
+    now = datetime.utcnow().replace(microsecond=0)
+
+    connection = db.engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        manifest = {
+            "tag": f"{int(time.time())}",
+            "users": users,
+            "creators": creators,
+            "events": events,
+            "inputs_per_event": inputs_per_event,
+            "participants_per_event": participants_per_event,
+            # Offset between consecutive events' member blocks, coprime with
+            # users so events spread over the whole user block
+            "stride": next(s for s in range(users // 3 + 1, users + users // 3 + 2) if math.gcd(s, users) == 1),
+            "first_user_id": next_id(cursor, 'users', 'user_id'),
+            "first_event_id": next_id(cursor, 'event', 'event_id'),
+            "first_input_id": next_id(cursor, 'inputs', 'input_id'),
+            "first_p_id": next_id(cursor, 'participants', 'p_id'),
+            "first_submission_id": next_id(cursor, 'submissions', 'submission_id')
+        }
+        data = Dataset(manifest)
+        first_suva_id = next_id(cursor, 'submission_values', 'suva_id')
+
+        print(f"Seeding dataset {data.tag}")
+        copy_rows(cursor, 'users', ['user_id', 'fname', 'lname', 'email', 'gender', 'dob', 'password'], (
+            (data.user_id(i), 'Bench', str(i), data.email(i), rng.choice(['male', 'female', 'other']),
+             date(1960, 1, 1) + timedelta(days=rng.randrange(16000)), pwhash)
+            for i in range(users)
+        ))
+        copy_rows(cursor, 'creator', ['creator_id'], ((data.user_id(i),) for i in range(creators)))
+
+        def event_rows():
+            for i in range(events):
+                start = now + timedelta(days=rng.randrange(-365, 365), hours=rng.randrange(24))
+                yield (
+                    data.event_id(i), data.creator_id(i),
+                    f"{rng.choice(WORDS)} {rng.choice(KINDS)} {i}", rng.choice(PLACES),
+                    start, start + timedelta(hours=rng.randrange(1, 72)), False, rng.choice(STATUSES), None
+                )
+        copy_rows(cursor, 'event', [
+            'event_id', 'creator_id', 'event_name', 'event_place', 'event_start_date',
+            'event_end_date', 'deadline_enforced', 'status', 'capacity'
+        ], event_rows())
+
+        copy_rows(cursor, 'inputs', ['input_id', 'event_id', 'label', 'field_type', 'default_value', 'validation_rules'], (
+            (input_id, data.event_id(i), f"Question {position + 1}", field_type, None,
+             INPUT_CYCLE[position % len(INPUT_CYCLE)][1])
+            for i in range(events)
+            for position, (input_id, field_type) in enumerate(data.input_ids(i))
+        ))
+        copy_rows(cursor, 'participants', ['p_id', 'user_id', 'event_id'], (
+            (data.p_id(i, member), data.participant_user_id(i, member), data.event_id(i))
+            for i in range(events)
+            for member in range(participants_per_event)
+        ))
+
+        # Which participants submitted, decided up front so submissions and
+        # their values get matching ids
+        submitted = [
+            (i, member) for i in range(events) for member in range(participants_per_event)
+            if rng.random() < submission_rate
+        ]
+        submission_counts = [0] * events
+        for i, _ in submitted:
+            submission_counts[i] += 1
+
+        copy_rows(cursor, 'submissions', ['submission_id', 'event_id', 'p_id', 'submitted_at'], (
+            (data.first_submission_id + n, data.event_id(i), data.p_id(i, member),
+             now - timedelta(minutes=rng.randrange(100000)))
+            for n, (i, member) in enumerate(submitted)
+        ))
+
+        def value_rows():
+            suva_id = first_suva_id
+            for n, (i, _) in enumerate(submitted):
+                for input_id, field_type in data.input_ids(i):
+                    yield suva_id, data.first_submission_id + n, input_id, sample_value(field_type, rng)
+                    suva_id += 1
+        copy_rows(cursor, 'submission_values', ['suva_id', 'submission_id', 'input_id', 'value'], value_rows())
+
+        copy_rows(cursor, 'event_counters', ['event_id', 'participant_count', 'submission_count'], (
+            (data.event_id(i), participants_per_event, submission_counts[i]) for i in range(events)
+        ))
+
+        for table, column in [
+            ('users', 'user_id'), ('event', 'event_id'), ('inputs', 'input_id'), ('participants', 'p_id'),
+            ('submissions', 'submission_id'), ('submission_values', 'suva_id')
+        ]:
+            advance_sequence(cursor, table, column)
+
+        connection.commit()
+
+        cursor.execute("ANALYZE")
+        connection.commit()
+    finally:
+        connection.close()
+    return manifest
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--users', type=int, default=10000)
+    parser.add_argument('--creators', type=int, default=100)
+    parser.add_argument('--events', type=int, default=1000)
+    parser.add_argument('--inputs-per-event', type=int, default=5)
+    parser.add_argument('--participants-per-event', type=int, default=50)
+    parser.add_argument('--submission-rate', type=float, default=0.6)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--manifest', default='bench-data.json', help='Where to write the dataset description')
+    args = parser.parse_args()
+
+    with app.app_context():
+        manifest = seed(
+            users=args.users,
+            creators=args.creators,
+            events=args.events,
+            inputs_per_event=args.inputs_per_event,
+            participants_per_event=args.participants_per_event,
+            submission_rate=args.submission_rate,
+            seed_value=args.seed
+        )
+
+    with open(args.manifest, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    print(f"Wrote {args.manifest}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+import threading
+import time
+from collections import OrderedDict
+
+# Small key/value caches used for rarely changing, frequently read data.
+# Values are strings so both backends can store them unchanged.
+
+class LRUCache:
+    def __init__(self, maxsize=1024, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+# Shared cache for multiple worker processes, invalidations are seen by all of them
+class RedisCache:
+    def __init__(self, url, ttl=300, prefix='db-project:'):
+        import redis  # Optional dependency, only needed for this backend
+
+        self.client = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key):
+        value = self.client.get(self.prefix + key)
+        return value.decode() if value is not None else None
+
+    def set(self, key, value):
+        self.client.set(self.prefix + key, value, ex=self.ttl)
+
+    def delete(self, *keys):
+        if keys:
+            self.client.delete(*[self.prefix + key for key in keys])
+
+def make_cache(backend='memory', url=None, maxsize=1024, ttl=300):
+    if backend == 'memory':
+        return LRUCache(maxsize=maxsize, ttl=ttl)
+    if backend == 'redis':
+        return RedisCache(url or 'redis://localhost:6379/0', ttl=ttl)
+    raise ValueError(f"Unknown cache backend: {backend}")
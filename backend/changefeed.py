@@ -0,0 +1,139 @@
+import json
+import select
+import threading
+import time
+
+# Live event counters for dashboards. Every counter change issues a pg_notify
+# on CHANNEL inside the writing transaction, so it is delivered on commit and
+# dropped on rollback. One listener thread per process LISTENs on a dedicated
+# connection and fans changes out to subscribers. Bursts are coalesced: a
+# subscriber is woken at most once per interval with the summed deltas and
+# the latest totals.
+
+CHANNEL = 'event_counters'
+
+class Subscriber:
+    def __init__(self, event_id, wake):
+        self.event_id = event_id
+        self.wake = wake
+        self.lock = threading.Lock()
+        self.pending = None
+
+    def push(self, change):
+        with self.lock:
+            if self.pending is None:
+                self.pending = dict(change)
+            else:
+                merge(self.pending, change)
+        self.wake()
+
+    # Returns the changes since the last call, or None
+    def take(self):
+        with self.lock:
+            change, self.pending = self.pending, None
+        return change
+
+# Folds a later change into an earlier one. Totals are authoritative, deltas
+# can miss changes made while the listener was reconnecting.
+def merge(into, change):
+    into['participants'] += change['participants']
+    into['submissions'] += change['submissions']
+    into['participant_count'] = change['participant_count']
+    into['submission_count'] = change['submission_count']
+
+# Payloads received on conn within timeout seconds, psycopg 3 or psycopg2
+def wait_for_notifications(conn, timeout):
+    if callable(conn.notifies):
+        return [n.payload for n in conn.notifies(timeout=timeout)]
+    if select.select([conn], [], [], timeout)[0]:
+        conn.poll()
+    payloads = [n.payload for n in conn.notifies]
+    conn.notifies.clear()
+    return payloads
+
+class ChangeFeed:
+    def __init__(self, engine, logger, interval=1.0, max_subscribers=1000):
+        self.engine = engine
+        self.logger = logger
+        self.interval = interval
+        self.max_subscribers = max_subscribers
+        self.lock = threading.Lock()
+        self.subscribers = {}
+        self.count = 0
+        self.thread = None
+
+    # wake is called from the listener thread when changes are pending.
+    # Returns None when the process already has max_subscribers.
+    def subscribe(self, event_id, wake):
+        with self.lock:
+            if self.count >= self.max_subscribers:
+                return None
+            subscriber = Subscriber(event_id, wake)
+            self.subscribers.setdefault(event_id, set()).add(subscriber)
+            self.count += 1
+            # Started on first use so each worker process gets its own
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name='changefeed', daemon=True)
+                self.thread.start()
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self.lock:
+            subscribers = self.subscribers.get(subscriber.event_id)
+            if subscribers and subscriber in subscribers:
+                subscribers.remove(subscriber)
+                self.count -= 1
+                if not subscribers:
+                    del self.subscribers[subscriber.event_id]
+
+    def connect(self):
+        # Detached from the pool, the listener holds it for the process lifetime
+        connection = self.engine.raw_connection()
+        connection.detach()
+        conn = connection.driver_connection
+        conn.rollback()
+        conn.autocommit = True
+        cursor = conn.cursor()
+        cursor.execute(f"LISTEN {CHANNEL}")
+        cursor.close()
+        return connection
+
+    def run(self):
+        while True:
+            connection = None
+            try:
+                connection = self.connect()
+                self.listen(connection.driver_connection)
+            except Exception:
+                self.logger.exception("Change feed listener failed, reconnecting")
+            finally:
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+            time.sleep(self.interval)
+
+    def listen(self, conn):
+        while True:
+            deadline = time.monotonic() + self.interval
+            pending = {}
+            remaining = self.interval
+            while remaining > 0:
+                for payload in wait_for_notifications(conn, remaining):
+                    change = json.loads(payload)
+                    if change['event_id'] not in self.subscribers:
+                        continue
+                    if change['event_id'] in pending:
+                        merge(pending[change['event_id']], change)
+                    else:
+                        pending[change['event_id']] = change
+                remaining = deadline - time.monotonic()
+            self.publish(pending)
+
+    def publish(self, pending):
+        for event_id, change in pending.items():
+            with self.lock:
+                subscribers = list(self.subscribers.get(event_id, ()))
+            for subscriber in subscribers:
+                subscriber.push(change)
@@ -0,0 +1,128 @@
+import re
+from datetime import date, datetime, timezone
+
+# Eligibility rules compiled from an event's Eligibility_Criteria rows.
+# Parsing happens once per event; checking a user is a few comparisons.
+
+DOMAIN_PATTERN = re.compile(r'^[a-z0-9.-]+$')
+
+class RuleError(ValueError):
+    pass
+
+def parse_int(value):
+    try:
+        number = int(value.strip())
+    except ValueError:
+        raise RuleError(f"Expected a whole number, got {value!r}")
+    if number < 0:
+        raise RuleError(f"Expected a non-negative number, got {value!r}")
+    return number
+
+def parse_datetime(value):
+    try:
+        moment = datetime.fromisoformat(value.strip())
+    except ValueError:
+        raise RuleError(f"Expected a date (YYYY-MM-DD), got {value!r}")
+    # Compared against naive UTC timestamps
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment
+
+def parse_list(value):
+    items = [item.strip().lower() for item in value.split(',') if item.strip()]
+    if not items:
+        raise RuleError("Expected a comma-separated list")
+    return items
+
+def narrow(current, new, pick):
+    return new if current is None else pick(current, new)
+
+def years_before(day, years):
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:  # Feb 29 in a non-leap year
+        return day.replace(year=day.year - years, day=28)
+
+class EligibilityRules:
+    def __init__(self):
+        self.min_age = None
+        self.max_age = None
+        self.genders = None
+        self.email_domains = None
+        self.capacity = None
+        self.opens = None
+        self.closes = None
+        self.ignored = []
+        self._bounds_day = None
+        self._bounds = (None, None)
+
+    # Several rows of the same type narrow the rule rather than replace it
+    def add(self, rule_type, rule_value):
+        rule_type = rule_type.strip().lower()
+        if rule_type == 'min_age':
+            self.min_age = narrow(self.min_age, parse_int(rule_value), max)
+        elif rule_type == 'max_age':
+            self.max_age = narrow(self.max_age, parse_int(rule_value), min)
+        elif rule_type == 'gender':
+            genders = set(parse_list(rule_value))
+            self.genders = genders if self.genders is None else self.genders & genders
+        elif rule_type == 'email_domain':
+            domains = set(parse_list(rule_value))
+            if not all(DOMAIN_PATTERN.match(d) for d in domains):
+                raise RuleError(f"Invalid email domain in {rule_value!r}")
+            self.email_domains = domains if self.email_domains is None else self.email_domains & domains
+        elif rule_type == 'capacity':
+            self.capacity = narrow(self.capacity, parse_int(rule_value), min)
+        elif rule_type == 'registration_opens':
+            self.opens = narrow(self.opens, parse_datetime(rule_value), max)
+        elif rule_type == 'registration_closes':
+            self.closes = narrow(self.closes, parse_datetime(rule_value), min)
+        else:
+            raise RuleError(f"Unknown rule type: {rule_type}")
+
+    # (latest allowed DOB, DOB must be after this) for the given day
+    def dob_bounds(self, today):
+        if self._bounds_day != today:
+            latest = years_before(today, self.min_age) if self.min_age is not None else None
+            earliest = years_before(today, self.max_age + 1) if self.max_age is not None else None
+            self._bounds = (latest, earliest)
+            self._bounds_day = today
+        return self._bounds
+
+    # Returns the reasons a user is not eligible, empty if eligible
+    def check_user(self, dob, gender, email, today=None):
+        reasons = []
+        if self.min_age is not None or self.max_age is not None:
+            latest, earliest = self.dob_bounds(today or date.today())
+            if dob is None:
+                reasons.append("Date of birth is required")
+            elif latest is not None and dob > latest:
+                reasons.append(f"Minimum age is {self.min_age}")
+            elif earliest is not None and dob <= earliest:
+                reasons.append(f"Maximum age is {self.max_age}")
+        if self.genders is not None and (gender or '').lower() not in self.genders:
+            reasons.append("Not open to this gender")
+        if self.email_domains is not None and (email or '').rsplit('@', 1)[-1].lower() not in self.email_domains:
+            reasons.append("Email domain not allowed")
+        return reasons
+
+    # Capacity is not checked here, it is enforced by the seat counter when joining
+    def check_event(self, now=None):
+        now = now or datetime.utcnow()
+        reasons = []
+        if self.opens is not None and now < self.opens:
+            reasons.append("Registration has not opened yet")
+        if self.closes is not None and now > self.closes:
+            reasons.append("Registration has closed")
+        return reasons
+
+# Rows with unknown or malformed rules are skipped and listed in rules.ignored,
+# add_criteria rejects them for new rows
+def compile_rules(criteria):
+    rules = EligibilityRules()
+    for rule_type, rule_value in criteria:
+        try:
+            rules.add(rule_type, rule_value)
+        except RuleError as e:
+            rules.ignored.append({"rule_type": rule_type, "error": str(e)})
+    return rules
@@ -0,0 +1,34 @@
+import multiprocessing
+import os
+
+# Production server settings, run from backend/ with: gunicorn -c gunicorn.conf.py
+# SERVER_MODE=wsgi (default) serves the Flask app with threaded workers,
+# SERVER_MODE=asgi serves asgi:application with uvicorn workers so the async
+# endpoints can hold many concurrent connections per process.
+# Reminder jobs are not sent from here: run 'flask --app app reminder-worker'
+# alongside (see README), or set REMINDER_WORKER_THREADS.
+
+mode = os.environ.get('SERVER_MODE', 'wsgi')
+if mode == 'wsgi':
+    wsgi_app = 'app:app'
+    worker_class = 'gthread'
+    threads = int(os.environ.get('WEB_THREADS', 8))
+elif mode == 'asgi':
+    wsgi_app = 'asgi:application'
+    worker_class = 'uvicorn.workers.UvicornWorker'
+else:
+    raise ValueError(f"Unknown SERVER_MODE: {mode}")
+
+bind = os.environ.get('BIND', '0.0.0.0:8000')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+# Each worker opens its own database pools, keep
+# workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) below Postgres' max_connections
+# and runs PASSWORD_HASH_WORKERS hashing processes (default 1), keep
+# workers * PASSWORD_HASH_WORKERS near the number of cores
+timeout = int(os.environ.get('WEB_TIMEOUT', 30))
+graceful_timeout = int(os.environ.get('WEB_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('WEB_KEEPALIVE', 5))
+# Recycle workers now and then so leaks can't accumulate
+max_requests = int(os.environ.get('WEB_MAX_REQUESTS', 10000))
+max_requests_jitter = max_requests // 10
+accesslog = os.environ.get('WEB_ACCESS_LOG', '-')
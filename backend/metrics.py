@@ -0,0 +1,90 @@
+import bisect
+import threading
+
+# Per-process request metrics rendered in the Prometheus text format. Each
+# observation is a bisect and a few additions under one lock, so it is cheap
+# enough to leave on. Under several worker processes every process reports
+# its own numbers; scrape each one or sum them in Prometheus.
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def lines(self, name, labels):
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            yield f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}'
+        yield f'{name}_bucket{{{labels},le="+Inf"}} {self.count}'
+        yield f'{name}_sum{{{labels}}} {self.total:.6f}'
+        yield f'{name}_count{{{labels}}} {self.count}'
+
+def escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+class RequestMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latency = {}
+        self.statements = {}
+        self.sql_seconds = {}
+        self.responses = {}
+        self.slow_queries = {}
+
+    def observe(self, endpoint, method, status, seconds, statements, sql_seconds):
+        key = (endpoint, method)
+        with self._lock:
+            if key not in self.latency:
+                self.latency[key] = Histogram(LATENCY_BUCKETS)
+                self.statements[key] = Histogram(STATEMENT_BUCKETS)
+                self.sql_seconds[key] = 0.0
+            self.latency[key].observe(seconds)
+            self.statements[key].observe(statements)
+            self.sql_seconds[key] += sql_seconds
+            status_key = (endpoint, method, status)
+            self.responses[status_key] = self.responses.get(status_key, 0) + 1
+
+    def observe_slow_query(self, endpoint):
+        with self._lock:
+            self.slow_queries[endpoint] = self.slow_queries.get(endpoint, 0) + 1
+
+    def render(self):
+        with self._lock:
+            lines = [
+                '# HELP http_request_duration_seconds Time spent handling the request in the view',
+                '# TYPE http_request_duration_seconds histogram'
+            ]
+            for (endpoint, method), histogram in sorted(self.latency.items()):
+                lines.extend(histogram.lines('http_request_duration_seconds', f'endpoint="{escape(endpoint)}",method="{method}"'))
+
+            lines.append('# HELP http_requests_total Responses by endpoint and status code')
+            lines.append('# TYPE http_requests_total counter')
+            for (endpoint, method, status), count in sorted(self.responses.items()):
+                lines.append(f'http_requests_total{{endpoint="{escape(endpoint)}",method="{method}",status="{status}"}} {count}')
+
+            lines.append('# HELP sql_statements_per_request SQL statements issued per request')
+            lines.append('# TYPE sql_statements_per_request histogram')
+            for (endpoint, method), histogram in sorted(self.statements.items()):
+                lines.extend(histogram.lines('sql_statements_per_request', f'endpoint="{escape(endpoint)}",method="{method}"'))
+
+            lines.append('# HELP sql_duration_seconds_total Time spent executing SQL statements')
+            lines.append('# TYPE sql_duration_seconds_total counter')
+            for (endpoint, method), seconds in sorted(self.sql_seconds.items()):
+                lines.append(f'sql_duration_seconds_total{{endpoint="{escape(endpoint)}",method="{method}"}} {seconds:.6f}')
+
+            lines.append('# HELP sql_slow_queries_total Statements slower than SLOW_QUERY_MS')
+            lines.append('# TYPE sql_slow_queries_total counter')
+            for endpoint, count in sorted(self.slow_queries.items()):
+                lines.append(f'sql_slow_queries_total{{endpoint="{escape(endpoint)}"}} {count}')
+        return '\n'.join(lines) + '\n'
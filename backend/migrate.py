@@ -0,0 +1,67 @@
+import os
+import re
+
+# Versioned SQL migrations. Each file in migrations/ is NNNN_description.sql
+# and is applied once, in version order, in its own transaction. Applied
+# versions are recorded in the schema_migrations table.
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
+FILENAME_PATTERN = re.compile(r'^(\d{4})_(\w+)\.sql$')
+
+def discover(directory=MIGRATIONS_DIR):
+    migrations = []
+    for filename in sorted(os.listdir(directory)):
+        match = FILENAME_PATTERN.match(filename)
+        if match:
+            migrations.append((match.group(1), match.group(2), os.path.join(directory, filename)))
+    return migrations
+
+def ensure_version_table(engine):
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE IF NOT EXISTS schema_migrations ("
+            "version VARCHAR(4) PRIMARY KEY, "
+            "name VARCHAR(255) NOT NULL, "
+            "applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+        )
+
+def applied_versions(engine):
+    ensure_version_table(engine)
+    with engine.connect() as conn:
+        return {row[0] for row in conn.exec_driver_sql("SELECT version FROM schema_migrations")}
+
+def pending(engine, target=None):
+    applied = applied_versions(engine)
+    return [
+        (version, name, path) for version, name, path in discover()
+        if version not in applied and (target is None or version <= target)
+    ]
+
+def record(conn, version, name):
+    conn.exec_driver_sql(
+        "INSERT INTO schema_migrations (version, name) VALUES (%(version)s, %(name)s)",
+        {"version": version, "name": name}
+    )
+
+def upgrade(engine, target=None, echo=print):
+    applied = []
+    for version, name, path in pending(engine, target):
+        with open(path) as migration:
+            sql = migration.read()
+        with engine.begin() as conn:
+            conn.exec_driver_sql(sql)
+            record(conn, version, name)
+        echo(f"Applied {version}_{name}")
+        applied.append(version)
+    return applied
+
+# Marks migrations up to target as applied without running them, for
+# databases created from db-project -schema.sql
+def stamp(engine, target=None, echo=print):
+    stamped = []
+    with engine.begin() as conn:
+        for version, name, _ in pending(engine, target):
+            record(conn, version, name)
+            echo(f"Stamped {version}_{name}")
+            stamped.append(version)
+    return stamped
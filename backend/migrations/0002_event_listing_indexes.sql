@@ -0,0 +1,7 @@
+-- Indexes for keyset-paginated event listing (GET /api/events)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX idx_event_start_id ON Event (event_start_date, event_id);
+CREATE INDEX idx_event_status_start_id ON Event (status, event_start_date, event_id);
+CREATE INDEX idx_event_creator_start_id ON Event (creator_id, event_start_date, event_id);
+CREATE INDEX idx_event_place_trgm ON Event USING GIN (event_place gin_trgm_ops);
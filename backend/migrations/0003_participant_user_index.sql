@@ -0,0 +1,2 @@
+-- Index for a user's participations joined to their events (GET /api/user/events)
+CREATE INDEX idx_participants_user_pid ON Participants (user_id, P_id);
@@ -0,0 +1,16 @@
+-- Materialized per-event counts backing GET /api/events/<id>/statistics
+CREATE TABLE Event_Counters (
+    event_id INT PRIMARY KEY REFERENCES Event(event_id) ON DELETE CASCADE,
+    participant_count INT NOT NULL DEFAULT 0,
+    submission_count INT NOT NULL DEFAULT 0
+);
+
+CREATE INDEX idx_participants_event ON Participants (event_id);
+CREATE INDEX idx_submissions_event ON Submissions (event_id);
+
+-- Backfill, same as 'flask rebuild-counters'
+INSERT INTO Event_Counters (event_id, participant_count, submission_count)
+SELECT e.event_id,
+       (SELECT count(*) FROM Participants p WHERE p.event_id = e.event_id),
+       (SELECT count(*) FROM Submissions s WHERE s.event_id = e.event_id)
+FROM Event e;
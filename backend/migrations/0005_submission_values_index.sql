@@ -0,0 +1,2 @@
+-- Index for pivoting a submission's values (GET /api/events/<id>/export)
+CREATE INDEX idx_submission_values_submission ON Submission_Values (submission_id, input_id);
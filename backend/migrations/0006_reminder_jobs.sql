@@ -0,0 +1,18 @@
+-- Durable queue of reminder requests (POST /api/events/<id>/reminders)
+CREATE TABLE Reminder_Jobs (
+    job_id SERIAL PRIMARY KEY,
+    event_id INT NOT NULL REFERENCES Event(event_id) ON DELETE CASCADE,
+    participant_ids TEXT,
+    status VARCHAR(20) NOT NULL DEFAULT 'queued' CHECK (status IN ('queued', 'running', 'done', 'failed')),
+    total INT NOT NULL DEFAULT 0,
+    sent INT NOT NULL DEFAULT 0,
+    failed INT NOT NULL DEFAULT 0,
+    last_P_id INT NOT NULL DEFAULT 0,
+    error TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    finished_at TIMESTAMP
+);
+
+CREATE INDEX idx_reminder_jobs_queued ON Reminder_Jobs (job_id) WHERE status = 'queued';
+CREATE INDEX idx_submissions_participant ON Submissions (P_id);
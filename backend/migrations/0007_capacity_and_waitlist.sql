@@ -0,0 +1,46 @@
+-- Event capacity and race-free participation (POST/DELETE /api/events/<id>/participate)
+ALTER TABLE Event ADD COLUMN capacity INT CHECK (capacity >= 0);
+
+-- Duplicates left by the old check-then-insert join. Their submissions and
+-- reminders move to the first participation before the duplicates are removed
+CREATE TEMPORARY TABLE participant_duplicates ON COMMIT DROP AS
+SELECT p.P_id, keep.P_id AS keep_id
+FROM Participants p
+JOIN (
+    SELECT user_id, event_id, min(P_id) AS P_id
+    FROM Participants
+    GROUP BY user_id, event_id
+    HAVING count(*) > 1
+) keep ON keep.user_id = p.user_id AND keep.event_id = p.event_id
+WHERE p.P_id <> keep.P_id;
+
+UPDATE Submissions s SET P_id = d.keep_id
+FROM participant_duplicates d
+WHERE s.P_id = d.P_id;
+
+UPDATE Reminders r SET P_id = d.keep_id
+FROM participant_duplicates d
+WHERE r.P_id = d.P_id;
+
+DELETE FROM Participants WHERE P_id IN (SELECT P_id FROM participant_duplicates);
+
+-- The counters backfilled by 0004 counted the duplicates, recompute them
+-- the same way 'flask rebuild-counters' does
+INSERT INTO Event_Counters (event_id, participant_count, submission_count)
+SELECT e.event_id,
+       (SELECT count(*) FROM Participants p WHERE p.event_id = e.event_id),
+       (SELECT count(*) FROM Submissions s WHERE s.event_id = e.event_id)
+FROM Event e
+ON CONFLICT (event_id) DO UPDATE SET
+    participant_count = EXCLUDED.participant_count,
+    submission_count = EXCLUDED.submission_count;
+
+CREATE UNIQUE INDEX uq_participants_user_event ON Participants (user_id, event_id);
+
+CREATE TABLE Waitlist (
+    waitlist_id SERIAL PRIMARY KEY,
+    event_id INT NOT NULL REFERENCES Event(event_id) ON DELETE CASCADE,
+    user_id INT NOT NULL REFERENCES Users(user_id) ON DELETE CASCADE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (event_id, user_id)
+);
@@ -0,0 +1,15 @@
+-- Users.password existed only in the model. Users created before this column
+-- get an unusable password and must reset it.
+ALTER TABLE Users ADD COLUMN password VARCHAR(255) NOT NULL DEFAULT '!';
+ALTER TABLE Users ALTER COLUMN password DROP DEFAULT;
+
+-- Indexes for the remaining foreign key access paths
+CREATE INDEX idx_participants_event_pid ON Participants (event_id, P_id);
+DROP INDEX idx_participants_event;
+CREATE INDEX idx_eligibility_criteria_event ON Eligibility_Criteria (event_id);
+CREATE INDEX idx_inputs_event ON Inputs (event_id);
+CREATE INDEX idx_event_statistics_event ON Event_Statistics (event_id);
+CREATE INDEX idx_submission_values_input ON Submission_Values (input_id);
+CREATE INDEX idx_reminders_event ON Reminders (event_id);
+CREATE INDEX idx_reminders_participant ON Reminders (P_id);
+CREATE INDEX idx_waitlist_event_order ON Waitlist (event_id, waitlist_id);
@@ -0,0 +1,10 @@
+-- Server-side sessions (SESSION_BACKEND=postgres), expired rows are removed by 'flask purge-sessions'
+CREATE TABLE Sessions (
+    sid VARCHAR(64) PRIMARY KEY,
+    data TEXT NOT NULL,
+    user_id INT,
+    creator_id INT,
+    expires_at TIMESTAMP NOT NULL
+);
+
+CREATE INDEX idx_sessions_expires ON Sessions (expires_at);
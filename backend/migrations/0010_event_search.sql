@@ -0,0 +1,8 @@
+-- Full-text and trigram search over events (GET /api/events/search)
+ALTER TABLE Event ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('simple', coalesce(event_name, '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce(event_place, '')), 'B')
+) STORED;
+
+CREATE INDEX idx_event_search ON Event USING GIN (search_vector);
+CREATE INDEX idx_event_name_trgm ON Event USING GIN (event_name gin_trgm_ops);
@@ -0,0 +1,20 @@
+-- Cold storage for finished events, filled by 'flask archive-events'. Yearly
+-- partitions are created by the command as it needs them.
+ALTER TABLE Event ADD COLUMN archived_at TIMESTAMP;
+
+CREATE TABLE Submission_Archive (
+    event_id INT NOT NULL REFERENCES Event(event_id) ON DELETE CASCADE,
+    submission_id INT NOT NULL,
+    P_id INT,
+    submitted_at TIMESTAMP NOT NULL,
+    response_values JSONB NOT NULL,
+    PRIMARY KEY (event_id, submission_id, submitted_at)
+) PARTITION BY RANGE (submitted_at);
+
+CREATE TABLE Reminder_Archive (
+    event_id INT NOT NULL REFERENCES Event(event_id) ON DELETE CASCADE,
+    reminder_id INT NOT NULL,
+    P_id INT,
+    sent_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (event_id, reminder_id, sent_at)
+) PARTITION BY RANGE (sent_at);
@@ -0,0 +1,3 @@
+-- Version of an event's submitted values, keys the analytics cache. Unlike
+-- submission_count it never goes back to an earlier value.
+ALTER TABLE Event_Counters ADD COLUMN analytics_version BIGINT NOT NULL DEFAULT 0;
@@ -0,0 +1,68 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from werkzeug.security import generate_password_hash, check_password_hash
+
+# Password hashing off the request threads. Hashes run in a bounded process
+# pool so CPU-bound work doesn't hold the GIL other requests need; workers=0
+# hashes inline. The pool is per web process, so the total number of hashing
+# processes is gunicorn workers times this; keep it small.
+
+DEFAULT_WORKERS = 1
+
+class HasherBusy(Exception):
+    pass
+
+def verify(pwhash, password):
+    try:
+        return check_password_hash(pwhash, password)
+    except (ValueError, TypeError):  # Unusable stored hash, e.g. '!'
+        return False
+
+def pool_context():
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+class PasswordHasher:
+    def __init__(self, method='scrypt', workers=None, queue_timeout=5.0):
+        # Werkzeug fills in default parameters, so compare against the full
+        # method string it actually writes
+        self.method = generate_password_hash('', method=method).split('$', 1)[0]
+        self.workers = DEFAULT_WORKERS if workers is None else workers
+        self.queue_timeout = queue_timeout
+        self._slots = threading.BoundedSemaphore(max(self.workers, 1) * 2)
+        self._pool = None
+        self._pool_pid = None
+        self._lock = threading.Lock()
+
+    # Created lazily and per process, pools don't survive a fork. Workers
+    # start from a fork server: forking a process that runs request, change
+    # feed and reminder threads can copy a held lock into the child.
+    def _executor(self):
+        with self._lock:
+            if self._pool is None or self._pool_pid != os.getpid():
+                self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=pool_context())
+                self._pool_pid = os.getpid()
+            return self._pool
+
+    def _run(self, fn, *args):
+        if self.workers == 0:
+            return fn(*args)
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            raise HasherBusy()
+        try:
+            return self._executor().submit(fn, *args).result()
+        finally:
+            self._slots.release()
+
+    def hash(self, password):
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, pwhash, password):
+        return self._run(verify, pwhash, password)
+
+    def needs_rehash(self, pwhash):
+        return pwhash.split('$', 1)[0] != self.method
@@ -0,0 +1,81 @@
+import json
+import smtplib
+import threading
+import time
+from email.message import EmailMessage
+
+# Delivery backends for reminder jobs. send_batch takes (to, subject, body)
+# tuples and returns one success flag per message.
+
+class FileSender:
+    # Local stand-in for SMTP, appends one JSON line per message
+    def __init__(self, path='reminders-outbox.jsonl'):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def send_batch(self, messages, limiter=None):
+        results = []
+        with self._lock, open(self.path, 'a') as outbox:
+            for to, subject, body in messages:
+                if limiter:
+                    limiter.acquire()
+                outbox.write(json.dumps({"to": to, "subject": subject, "body": body}) + "\n")
+                results.append(True)
+        return results
+
+class SMTPSender:
+    def __init__(self, host='localhost', port=25, from_addr='noreply@localhost'):
+        self.host = host
+        self.port = port
+        self.from_addr = from_addr
+
+    def send_batch(self, messages, limiter=None):
+        results = []
+        # One connection per batch rather than per message
+        with smtplib.SMTP(self.host, self.port) as smtp:
+            for to, subject, body in messages:
+                if limiter:
+                    limiter.acquire()
+                message = EmailMessage()
+                message['From'] = self.from_addr
+                message['To'] = to
+                message['Subject'] = subject
+                message.set_content(body)
+                try:
+                    smtp.send_message(message)
+                    results.append(True)
+                except smtplib.SMTPException:
+                    results.append(False)
+        return results
+
+# Token bucket, a rate of 0 disables limiting
+class RateLimiter:
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if self.rate <= 0:
+            return
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                time.sleep((1 - self.tokens) / self.rate)
+
+def make_sender(backend='file', **options):
+    if backend == 'file':
+        return FileSender(options.get('path') or 'reminders-outbox.jsonl')
+    if backend == 'smtp':
+        return SMTPSender(
+            host=options.get('host') or 'localhost',
+            port=int(options.get('port') or 25),
+            from_addr=options.get('from_addr') or 'noreply@localhost'
+        )
+    raise ValueError(f"Unknown reminder sender: {backend}")
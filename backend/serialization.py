@@ -0,0 +1,89 @@
+import dataclasses
+import decimal
+import json
+import uuid
+from datetime import date, datetime, time
+from operator import attrgetter
+
+from flask.json.provider import JSONProvider
+from sqlalchemy import inspect
+
+try:
+    import orjson
+except ImportError:  # Optional, the standard library encoder is used without it
+    orjson = None
+
+# Response serialization. Model rows go through per-model serializers built
+# once from the table's columns, and JSON is encoded with orjson when it is
+# installed. Dates and datetimes are written as ISO 8601 either way.
+
+STREAM_CHUNK_SIZE = 500
+
+def default(o):
+    if isinstance(o, (datetime, date, time)):
+        return o.isoformat()
+    if isinstance(o, (decimal.Decimal, uuid.UUID)):
+        return str(o)
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    if hasattr(o, '__html__'):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+if orjson is not None:
+    def dumps_bytes(obj):
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+
+    loads = orjson.loads
+else:
+    def dumps_bytes(obj):
+        return json.dumps(obj, default=default, separators=(',', ':')).encode()
+
+    loads = json.loads
+
+class FastJSONProvider(JSONProvider):
+    def dumps(self, obj, **kwargs):
+        return dumps_bytes(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return loads(s)
+
+    # Skips the str round trip, the encoder already produces bytes
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_bytes(obj), mimetype='application/json')
+
+def column_keys(model):
+    return tuple(attr.key for attr in inspect(model).column_attrs)
+
+# Returns a function turning an instance of model into a dict of its columns,
+# keyed by attribute name (P_id, not the p_id column)
+_serializers = {}
+
+def serializer_for(model):
+    serialize = _serializers.get(model)
+    if serialize is None:
+        keys = column_keys(model)
+        getter = attrgetter(*keys)
+        if len(keys) == 1:
+            serialize = lambda obj: {keys[0]: getter(obj)}
+        else:
+            serialize = lambda obj: dict(zip(keys, getter(obj)))
+        _serializers[model] = serialize
+    return serialize
+
+# JSON array body produced in chunks, for lists too large to build in memory.
+# Use with Response(stream_with_context(...), mimetype='application/json').
+def stream_array(items, serialize=None, chunk_size=STREAM_CHUNK_SIZE):
+    yield b'['
+    chunk = []
+    first = True
+    for item in items:
+        chunk.append(dumps_bytes(serialize(item) if serialize else item))
+        if len(chunk) >= chunk_size:
+            yield (b'' if first else b',') + b','.join(chunk)
+            chunk = []
+            first = False
+    if chunk:
+        yield (b'' if first else b',') + b','.join(chunk)
+    yield b']'
@@ -0,0 +1,142 @@
+import json
+import secrets
+from datetime import datetime
+
+from flask.sessions import SessionInterface, SessionMixin
+from sqlalchemy import text
+from werkzeug.datastructures import CallbackDict
+
+from cache import LRUCache
+
+# Server-side sessions: the cookie carries only a random session id, the data
+# lives in Postgres or Redis so every worker process sees the same logins.
+
+def new_sid():
+    return secrets.token_urlsafe(32)
+
+class ServerSession(CallbackDict, SessionMixin):
+    def __init__(self, initial=None, sid=None, new=False):
+        def on_update(session):
+            session.modified = True
+
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.modified = False
+        self.loaded_user = self.get('user_id')
+
+class PostgresSessionStore:
+    def __init__(self, engine):
+        self.engine = engine
+
+    def load(self, sid):
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                text("SELECT data FROM sessions WHERE sid = :sid AND expires_at > :now"),
+                {"sid": sid, "now": datetime.utcnow()}
+            ).first()
+        return row[0] if row else None
+
+    def save(self, sid, data, user_id, creator_id, expires_at):
+        with self.engine.begin() as conn:
+            conn.execute(text(
+                "INSERT INTO sessions (sid, data, user_id, creator_id, expires_at) "
+                "VALUES (:sid, :data, :user_id, :creator_id, :expires_at) "
+                "ON CONFLICT (sid) DO UPDATE SET data = EXCLUDED.data, user_id = EXCLUDED.user_id, "
+                "creator_id = EXCLUDED.creator_id, expires_at = EXCLUDED.expires_at"
+            ), {"sid": sid, "data": data, "user_id": user_id, "creator_id": creator_id, "expires_at": expires_at})
+
+    def delete(self, sid):
+        with self.engine.begin() as conn:
+            conn.execute(text("DELETE FROM sessions WHERE sid = :sid"), {"sid": sid})
+
+    # Removes all expired sessions in one statement, returns how many
+    def cleanup(self):
+        with self.engine.begin() as conn:
+            result = conn.execute(text("DELETE FROM sessions WHERE expires_at <= :now"), {"now": datetime.utcnow()})
+        return result.rowcount
+
+class RedisSessionStore:
+    def __init__(self, url, prefix='db-project:session:'):
+        import redis  # Optional dependency, only needed for this backend
+
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def load(self, sid):
+        data = self.client.get(self.prefix + sid)
+        return data.decode() if data is not None else None
+
+    def save(self, sid, data, user_id, creator_id, expires_at):
+        ttl = max(int((expires_at - datetime.utcnow()).total_seconds()), 1)
+        self.client.set(self.prefix + sid, data, ex=ttl)
+
+    def delete(self, sid):
+        self.client.delete(self.prefix + sid)
+
+    # Redis expires keys itself
+    def cleanup(self):
+        return 0
+
+class ServerSessionInterface(SessionInterface):
+    def __init__(self, store, cache_ttl=10, cache_size=10000):
+        self.store = store
+        # Short-lived per-process cache so most requests skip the store lookup.
+        # A logout seen by another process takes effect there after cache_ttl.
+        self.cache = LRUCache(maxsize=cache_size, ttl=cache_ttl)
+
+    def open_session(self, app, request):
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid:
+            data = self.cache.get(sid)
+            if data is None:
+                data = self.store.load(sid)
+                if data is not None:
+                    self.cache.set(sid, data)
+            if data is not None:
+                return ServerSession(json.loads(data), sid=sid)
+        return ServerSession(sid=new_sid(), new=True)
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if not session:
+            if session.modified and not session.new:
+                self.store.delete(session.sid)
+                self.cache.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path)
+            return
+        if not session.modified:
+            return
+
+        # New id on login or user switch so a planted session id is useless
+        if not session.new and session.get('user_id') != session.loaded_user:
+            self.store.delete(session.sid)
+            self.cache.delete(session.sid)
+            session.sid = new_sid()
+
+        expires_at = datetime.utcnow() + app.permanent_session_lifetime
+        data = json.dumps(dict(session))
+        self.store.save(session.sid, data, session.get('user_id'), session.get('creator_id'), expires_at)
+        self.cache.set(session.sid, data)
+        response.set_cookie(
+            name,
+            session.sid,
+            expires=expires_at,
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app)
+        )
+
+def make_session_store(backend='postgres', engine=None, url=None):
+    if backend == 'cookie':
+        return None
+    if backend == 'postgres':
+        return PostgresSessionStore(engine)
+    if backend == 'redis':
+        return RedisSessionStore(url or 'redis://localhost:6379/0')
+    raise ValueError(f"Unknown session backend: {backend}")
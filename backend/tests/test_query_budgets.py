@@ -0,0 +1,138 @@
+import os
+import sys
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+# SQL statement budgets of the read endpoints, checked against a real
+# database. Each endpoint has N rows behind it, so an N+1 pattern shows up as
+# a count above its @query_budget. Needs DATABASE_URL pointing at a disposable
+# database, pending migrations are applied to it. Run from backend/ with:
+# DATABASE_URL=postgresql://... python -m pytest tests
+
+if not os.environ.get('DATABASE_URL'):
+    pytest.skip("DATABASE_URL is not set", allow_module_level=True)
+
+os.environ['ENFORCE_QUERY_BUDGETS'] = '1'
+os.environ.setdefault('SESSION_BACKEND', 'cookie')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import migrate
+from app import (
+    app, db, Users, Creator, Event, Participants, Inputs, Eligibility_Criteria, Event_Counters,
+    invalidate_event_metadata
+)
+
+N = 25
+
+@pytest.fixture(scope='module')
+def seeded():
+    app.config['TESTING'] = True
+    with app.app_context():
+        migrate.upgrade(db.engine, echo=lambda message: None)
+
+        tag = uuid.uuid4().hex[:8]
+        user = Users(FName='Budget', LName='Participant', email=f'budget-{tag}@example.com', password='-')
+        owner = Users(FName='Budget', LName='Creator', email=f'budget-creator-{tag}@example.com', password='-')
+        db.session.add_all([user, owner])
+        db.session.flush()
+        db.session.add(Creator(creator_id=owner.user_id))
+        db.session.flush()
+
+        start = datetime.utcnow() + timedelta(days=30)
+        events = [
+            Event(
+                creator_id=owner.user_id, event_name=f"Budget {tag} {i}", event_place="Main Hall",
+                event_start_date=start + timedelta(hours=i), event_end_date=start + timedelta(hours=i + 2),
+                status='Open'
+            )
+            for i in range(N)
+        ]
+        db.session.add_all(events)
+        db.session.flush()
+
+        for event in events:
+            db.session.add(Participants(user_id=user.user_id, event_id=event.event_id))
+            db.session.add(Event_Counters(event_id=event.event_id, participant_count=1))
+        db.session.add_all([
+            Inputs(event_id=events[0].event_id, label=f"Question {i}", field_type='text') for i in range(N)
+        ])
+        db.session.add_all([
+            Eligibility_Criteria(event_id=events[0].event_id, rule_type='min_age', rule_value=str(i)) for i in range(N)
+        ])
+        db.session.commit()
+
+        yield {
+            "tag": tag,
+            "user_id": user.user_id,
+            "creator_id": owner.user_id,
+            "event_id": events[0].event_id
+        }
+
+        # Creator, events and everything under them cascade
+        Users.query.filter(Users.user_id.in_([user.user_id, owner.user_id])).delete(synchronize_session=False)
+        db.session.commit()
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+def login(client, **values):
+    with client.session_transaction() as sess:
+        sess.update(values)
+
+def budget(endpoint):
+    return app.view_functions[endpoint].query_budget
+
+def statements(response):
+    return int(response.headers['X-SQL-Statements'])
+
+@pytest.mark.parametrize('path, endpoint', [
+    ('/api/events/{event_id}', 'get_event'),
+    ('/api/events/{event_id}/bundle', 'get_event_bundle'),
+    ('/api/events/{event_id}/inputs', 'get_inputs'),
+    ('/api/events/{event_id}/criteria', 'get_criteria')
+])
+def test_cached_metadata(seeded, client, path, endpoint):
+    with app.app_context():
+        invalidate_event_metadata(seeded['event_id'])
+    url = path.format(**seeded)
+
+    miss = client.get(url)
+    assert miss.status_code == 200
+    assert statements(miss) <= budget(endpoint)
+
+    hit = client.get(url)
+    assert hit.status_code == 200
+    assert statements(hit) == 0
+
+def test_get_events(seeded, client):
+    response = client.get('/api/events?status=Open&limit=100')
+    assert response.status_code == 200
+    assert statements(response) <= budget('get_events')
+
+def test_get_user_events(seeded, client):
+    login(client, user_id=seeded['user_id'])
+    response = client.get('/api/user/events?limit=100')
+    assert response.status_code == 200
+    assert len(response.get_json()['events']) == N
+    assert statements(response) <= budget('get_user_events')
+
+def test_get_creator_events(seeded, client):
+    # Streamed, so the budget is enforced when the body finishes
+    login(client, creator_id=seeded['creator_id'])
+    response = client.get('/api/creator/events')
+    assert response.status_code == 200
+    assert len(response.get_json()) == N
+
+def test_get_event_statistics(seeded, client):
+    response = client.get(f"/api/events/{seeded['event_id']}/statistics")
+    assert response.status_code == 200
+    assert response.get_json()['computed_statistics']['participant_count'] == 1
+    assert statements(response) <= budget('get_event_statistics')
+
+def test_search_events(seeded, client):
+    response = client.get(f"/api/events/search?q=budget {seeded['tag']}")
+    assert response.status_code == 200
+    assert statements(response) <= budget('search_events')
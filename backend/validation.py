@@ -0,0 +1,190 @@
+import json
+import math
+import re
+from datetime import date
+
+# Submission validators compiled from an event's Inputs rows. Each input's
+# field_type and validation_rules (a JSON object) become one coercion function,
+# so validating a submission is a loop over prepared closures.
+
+FIELD_TYPES = ('text', 'number', 'date', 'boolean', 'select')
+RULE_KEYS = {'required', 'min', 'max', 'min_length', 'max_length', 'pattern', 'options', 'integer'}
+TRUE_VALUES = {'true', 'yes', 'on', '1'}
+FALSE_VALUES = {'false', 'no', 'off', '0'}
+
+class ValidationRuleError(ValueError):
+    pass
+
+def is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def parse_rules(raw):
+    if not raw:
+        return {}
+    try:
+        rules = json.loads(raw)
+    except ValueError:
+        raise ValidationRuleError("validation_rules must be a JSON object")
+    if not isinstance(rules, dict):
+        raise ValidationRuleError("validation_rules must be a JSON object")
+    unknown = set(rules) - RULE_KEYS
+    if unknown:
+        raise ValidationRuleError(f"Unknown validation rules: {', '.join(sorted(unknown))}")
+    if 'pattern' in rules:
+        try:
+            re.compile(rules['pattern'])
+        except (re.error, TypeError):
+            raise ValidationRuleError("pattern must be a valid regular expression")
+    if 'options' in rules and not isinstance(rules['options'], list):
+        raise ValidationRuleError("options must be a list")
+    for key in ('min_length', 'max_length'):
+        if key in rules and not (isinstance(rules[key], int) and not isinstance(rules[key], bool) and rules[key] >= 0):
+            raise ValidationRuleError(f"{key} must be a non-negative integer")
+    # Numbers for number fields, YYYY-MM-DD strings for date fields
+    for key in ('min', 'max'):
+        if key in rules and not (is_number(rules[key]) or isinstance(rules[key], str)):
+            raise ValidationRuleError(f"{key} must be a number or a date")
+    for key in ('required', 'integer'):
+        if key in rules and not isinstance(rules[key], bool):
+            raise ValidationRuleError(f"{key} must be true or false")
+    return rules
+
+def text_field(rules):
+    min_length = rules.get('min_length')
+    max_length = rules.get('max_length')
+    pattern = re.compile(rules['pattern']) if 'pattern' in rules else None
+
+    def coerce(value):
+        value = str(value)
+        if min_length is not None and len(value) < min_length:
+            raise ValueError(f"Must be at least {min_length} characters")
+        if max_length is not None and len(value) > max_length:
+            raise ValueError(f"Must be at most {max_length} characters")
+        if pattern is not None and not pattern.fullmatch(value):
+            raise ValueError("Does not match the required format")
+        return value
+    return coerce
+
+def number_field(rules):
+    low = rules.get('min')
+    high = rules.get('max')
+    integer = rules.get('integer', False)
+    if not all(bound is None or is_number(bound) for bound in (low, high)):
+        raise ValueError("min and max must be numbers")
+
+    def coerce(value):
+        if isinstance(value, bool):
+            raise ValueError("Must be a number")
+        try:
+            number = float(value)
+        except (TypeError, ValueError, OverflowError):
+            raise ValueError("Must be a number")
+        if not math.isfinite(number):
+            raise ValueError("Must be a finite number")
+        if integer and not number.is_integer():
+            raise ValueError("Must be a whole number")
+        if low is not None and number < low:
+            raise ValueError(f"Must be at least {low}")
+        if high is not None and number > high:
+            raise ValueError(f"Must be at most {high}")
+        return str(int(number)) if number.is_integer() else repr(number)
+    return coerce
+
+def date_field(rules):
+    low = date.fromisoformat(rules['min']) if 'min' in rules else None
+    high = date.fromisoformat(rules['max']) if 'max' in rules else None
+
+    def coerce(value):
+        try:
+            day = date.fromisoformat(str(value).strip())
+        except ValueError:
+            raise ValueError("Must be a date (YYYY-MM-DD)")
+        if low is not None and day < low:
+            raise ValueError(f"Must be on or after {low.isoformat()}")
+        if high is not None and day > high:
+            raise ValueError(f"Must be on or before {high.isoformat()}")
+        return day.isoformat()
+    return coerce
+
+def boolean_field(rules):
+    def coerce(value):
+        if isinstance(value, bool):
+            return 'true' if value else 'false'
+        value = str(value).strip().lower()
+        if value in TRUE_VALUES:
+            return 'true'
+        if value in FALSE_VALUES:
+            return 'false'
+        raise ValueError("Must be true or false")
+    return coerce
+
+def select_field(rules):
+    options = frozenset(str(option) for option in rules['options']) if 'options' in rules else None
+
+    def coerce(value):
+        value = str(value)
+        if options is not None and value not in options:
+            raise ValueError("Not one of the allowed options")
+        return value
+    return coerce
+
+FIELD_COMPILERS = {
+    'text': text_field,
+    'number': number_field,
+    'date': date_field,
+    'boolean': boolean_field,
+    'select': select_field
+}
+
+# Returns (coerce, required, default) for one input, raises ValidationRuleError
+# if the input's definition is unusable
+def compile_field(field_type, validation_rules, default_value=None):
+    if field_type not in FIELD_COMPILERS:
+        raise ValidationRuleError(f"field_type must be one of {', '.join(FIELD_TYPES)}")
+    rules = parse_rules(validation_rules)
+    try:
+        coerce = FIELD_COMPILERS[field_type](rules)
+    except (TypeError, ValueError, OverflowError) as e:
+        raise ValidationRuleError(f"Invalid validation rules: {e}")
+
+    default = None
+    if default_value not in (None, ''):
+        try:
+            default = coerce(default_value)
+        except ValueError as e:
+            raise ValidationRuleError(f"Invalid default value: {e}")
+    return coerce, bool(rules.get('required')), default
+
+class SubmissionValidator:
+    # inputs are dicts with input_id, field_type, validation_rules, default_value
+    def __init__(self, inputs):
+        self.fields = {}
+        self.ignored = []
+        for field in inputs:
+            try:
+                compiled = compile_field(field['field_type'], field['validation_rules'], field['default_value'])
+            except ValidationRuleError as e:
+                # Rows predating validation keep accepting any value
+                self.ignored.append({"input_id": field['input_id'], "error": str(e)})
+                compiled = (str, False, None)
+            self.fields[field['input_id']] = compiled
+        self.input_ids = frozenset(self.fields)
+
+    # responses maps input_id to the raw value. Returns (values, errors), with
+    # values as the strings to store and errors keyed by input_id
+    def validate(self, responses):
+        values = {}
+        errors = {}
+        for input_id, (coerce, required, default) in self.fields.items():
+            raw = responses.get(input_id)
+            if raw is None or raw == '':
+                if default is not None:
+                    values[input_id] = default
+                elif required:
+                    errors[input_id] = "This field is required"
+                continue
+            try:
+                values[input_id] = coerce(raw)
+            except ValueError as e:
+                errors[input_id] = str(e)
+        return values, errors
@@ -1,10 +1,14 @@
+-- Full schema for a new database, equivalent to applying every file in
+-- backend/migrations. Existing databases upgrade with 'flask db-upgrade'.
+
 CREATE TABLE Users (
     user_id SERIAL PRIMARY KEY,
     FName VARCHAR(100) NOT NULL,
     LName VARCHAR(100) NOT NULL,
     email VARCHAR(255) UNIQUE NOT NULL,
     gender VARCHAR(10),
-    DOB DATE
+    DOB DATE,
+    password VARCHAR(255) NOT NULL
 );
 
 CREATE TABLE Creator (
@@ -19,7 +23,13 @@ CREATE TABLE Event (
     event_start_date TIMESTAMP NOT NULL,
     event_end_date TIMESTAMP NOT NULL,
     deadline_enforced BOOLEAN DEFAULT FALSE,
-    status VARCHAR(50) CHECK (status IN ('Open', 'Closed', 'Cancelled'))
+    status VARCHAR(50) CHECK (status IN ('Open', 'Closed', 'Cancelled')),
+    capacity INT CHECK (capacity >= 0),
+    search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(event_name, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(event_place, '')), 'B')
+    ) STORED,
+    archived_at TIMESTAMP
 );
 
 CREATE TABLE Participants (
@@ -71,3 +81,101 @@ CREATE TABLE Reminders (
     P_id INT REFERENCES Participants(P_id) ON DELETE CASCADE,
     sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
+
+-- Indexes for keyset-paginated event listing (GET /api/events)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX idx_event_start_id ON Event (event_start_date, event_id);
+CREATE INDEX idx_event_status_start_id ON Event (status, event_start_date, event_id);
+CREATE INDEX idx_event_creator_start_id ON Event (creator_id, event_start_date, event_id);
+CREATE INDEX idx_event_place_trgm ON Event USING GIN (event_place gin_trgm_ops);
+
+-- Index for a user's participations joined to their events (GET /api/user/events)
+CREATE INDEX idx_participants_user_pid ON Participants (user_id, P_id);
+
+-- Materialized per-event counts backing GET /api/events/<id>/statistics
+CREATE TABLE Event_Counters (
+    event_id INT PRIMARY KEY REFERENCES Event(event_id) ON DELETE CASCADE,
+    participant_count INT NOT NULL DEFAULT 0,
+    submission_count INT NOT NULL DEFAULT 0,
+    analytics_version BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE INDEX idx_submissions_event ON Submissions (event_id);
+
+-- Index for pivoting a submission's values (GET /api/events/<id>/export)
+CREATE INDEX idx_submission_values_submission ON Submission_Values (submission_id, input_id);
+
+-- Durable queue of reminder requests (POST /api/events/<id>/reminders)
+CREATE TABLE Reminder_Jobs (
+    job_id SERIAL PRIMARY KEY,
+    event_id INT NOT NULL REFERENCES Event(event_id) ON DELETE CASCADE,
+    participant_ids TEXT,
+    status VARCHAR(20) NOT NULL DEFAULT 'queued' CHECK (status IN ('queued', 'running', 'done', 'failed')),
+    total INT NOT NULL DEFAULT 0,
+    sent INT NOT NULL DEFAULT 0,
+    failed INT NOT NULL DEFAULT 0,
+    last_P_id INT NOT NULL DEFAULT 0,
+    error TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    finished_at TIMESTAMP
+);
+
+CREATE INDEX idx_reminder_jobs_queued ON Reminder_Jobs (job_id) WHERE status = 'queued';
+CREATE INDEX idx_submissions_participant ON Submissions (P_id);
+
+-- Race-free participation (POST/DELETE /api/events/<id>/participate)
+CREATE UNIQUE INDEX uq_participants_user_event ON Participants (user_id, event_id);
+
+CREATE TABLE Waitlist (
+    waitlist_id SERIAL PRIMARY KEY,
+    event_id INT NOT NULL REFERENCES Event(event_id) ON DELETE CASCADE,
+    user_id INT NOT NULL REFERENCES Users(user_id) ON DELETE CASCADE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (event_id, user_id)
+);
+
+-- Indexes for the remaining foreign key access paths
+CREATE INDEX idx_participants_event_pid ON Participants (event_id, P_id);
+CREATE INDEX idx_eligibility_criteria_event ON Eligibility_Criteria (event_id);
+CREATE INDEX idx_inputs_event ON Inputs (event_id);
+CREATE INDEX idx_event_statistics_event ON Event_Statistics (event_id);
+CREATE INDEX idx_submission_values_input ON Submission_Values (input_id);
+CREATE INDEX idx_reminders_event ON Reminders (event_id);
+CREATE INDEX idx_reminders_participant ON Reminders (P_id);
+CREATE INDEX idx_waitlist_event_order ON Waitlist (event_id, waitlist_id);
+
+-- Server-side sessions (SESSION_BACKEND=postgres), expired rows are removed by 'flask purge-sessions'
+CREATE TABLE Sessions (
+    sid VARCHAR(64) PRIMARY KEY,
+    data TEXT NOT NULL,
+    user_id INT,
+    creator_id INT,
+    expires_at TIMESTAMP NOT NULL
+);
+
+CREATE INDEX idx_sessions_expires ON Sessions (expires_at);
+
+-- Full-text and trigram search over events (GET /api/events/search)
+CREATE INDEX idx_event_search ON Event USING GIN (search_vector);
+CREATE INDEX idx_event_name_trgm ON Event USING GIN (event_name gin_trgm_ops);
+
+-- Cold storage for finished events, filled by 'flask archive-events'. Yearly
+-- partitions are created by the command as it needs them.
+CREATE TABLE Submission_Archive (
+    event_id INT NOT NULL REFERENCES Event(event_id) ON DELETE CASCADE,
+    submission_id INT NOT NULL,
+    P_id INT,
+    submitted_at TIMESTAMP NOT NULL,
+    response_values JSONB NOT NULL,
+    PRIMARY KEY (event_id, submission_id, submitted_at)
+) PARTITION BY RANGE (submitted_at);
+
+CREATE TABLE Reminder_Archive (
+    event_id INT NOT NULL REFERENCES Event(event_id) ON DELETE CASCADE,
+    reminder_id INT NOT NULL,
+    P_id INT,
+    sent_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (event_id, reminder_id, sent_at)
+) PARTITION BY RANGE (sent_at);